@@ -7,12 +7,58 @@
 
 import os
 import sys
+import errno
 import shutil
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Tuple
+import fnmatch
 import hashlib
+import mmap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 
+# 可选依赖：blake3比MD5快得多，未安装时回退到hashlib.md5
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# 计算哈希时每次读取的块大小
+HASH_CHUNK_SIZE = 1 << 20
+# 超过该大小的文件使用mmap一次性计算哈希
+MMAP_THRESHOLD = 64 << 20
+# 默认跳过的目录（支持通配符），其中多为微信的缓存、缩略图和表情
+DEFAULT_EXCLUDE_DIRS = {'CustomEmotion', 'Cache*', 'Thumb*'}
+# 同名文件锁的分段数量
+NAME_LOCK_STRIPES = 64
+# 日志缓冲区每积累多少行或每隔多少秒输出一次
+LOG_FLUSH_LINES = 100
+LOG_FLUSH_INTERVAL = 0.2
+# 总数未知（扫描阶段）时，每发现多少个文件报告一次进度
+SCAN_PROGRESS_STEP = 100
+
+if sys.platform == 'win32':
+    import ctypes
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# 整理方式：复制、硬链接、reflink克隆、移动
+TRANSFER_MODES = ('copy', 'link', 'reflink', 'move')
+# 实际执行的动作在日志中的显示（link/reflink/move无法执行时会回退为其他动作）
+_TRANSFER_VERBS = {'copy': '已复制', 'link': '已链接', 'reflink': '已克隆', 'move': '已移动',
+                   'copy_move': '已移动（跨设备，复制后删除源文件）'}
+# Linux FICLONE ioctl请求号，让目标文件与源文件共享数据块
+_FICLONE = 0x40049409
+
+# copy_file_range不可用时回退到普通复制的错误码
+_COPY_FALLBACK_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP}
+
 # 设置控制台编码支持特殊字符
 try:
     if sys.platform == 'win32':
@@ -34,8 +80,77 @@ def safe_print(text):
             # 最后的备选方案
             print("[无法显示的特殊字符]")
 
+
+def _fast_copy(src, dst):
+    """复制文件内容和元数据，尽量让系统内核完成复制（效果同shutil.copy2）"""
+    if sys.platform == 'win32':
+        # CopyFileExW由系统完成复制，不经过Python缓冲区
+        if not ctypes.windll.kernel32.CopyFileExW(str(src), str(dst), None, None, None, 0):
+            raise ctypes.WinError()
+    elif hasattr(os, 'copy_file_range'):
+        # Linux上copy_file_range在内核中复制，btrfs/xfs等支持reflink时无需复制数据
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining > 0:
+                # 内核未能复制完整内容，改用普通复制
+                shutil.copyfile(src, dst)
+        except OSError as e:
+            if e.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+            shutil.copyfile(src, dst)
+    else:
+        shutil.copyfile(src, dst)
+
+    shutil.copystat(src, dst)
+
+
+def _advise_sequential(fd):
+    """提示内核该文件将被顺序读取，并立即开始预读（仅支持posix_fadvise的系统）"""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+
+
+def _prefetch_file(path):
+    """让内核在后台将文件读入页缓存，不等待读取完成"""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _reflink_copy(src, dst) -> bool:
+    """在btrfs/xfs等支持reflink的文件系统上克隆文件，不支持时回退到普通复制；返回是否成功克隆"""
+    if fcntl is not None and sys.platform.startswith('linux'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return True
+        except OSError:
+            pass
+    _fast_copy(src, dst)
+    return False
+
 class WeChatFileOrganizer:
-    def __init__(self, source_dir: str, target_dir: str, progress_callback=None):
+    def __init__(self, source_dir: str, target_dir: str, progress_callback=None, max_workers: int = None,
+                 exclude_dirs=None, log_callback=None, mode: str = 'copy'):
         """
         初始化文件整理器
 
@@ -43,10 +158,25 @@ class WeChatFileOrganizer:
             source_dir: 微信文件夹路径
             target_dir: 目标整理路径
             progress_callback: 进度回调函数，接收(current, total, filename)参数
+            max_workers: 同时处理文件的线程数，默认根据路径类型自动选择
+            exclude_dirs: 扫描时跳过的目录名集合（支持通配符），默认为DEFAULT_EXCLUDE_DIRS；
+                以"."开头的隐藏目录总是跳过
+            log_callback: 日志回调函数，每次接收一段（可能多行的）日志文本，默认输出到控制台
+            mode: 整理方式，可选值见TRANSFER_MODES：
+                copy（复制，默认）、link（硬链接，不占用额外空间）、
+                reflink（写时复制克隆）、move（移动，会删除源文件）；
+                link/move无法在源和目标之间使用时自动回退为复制
         """
+        if mode not in TRANSFER_MODES:
+            raise ValueError(f"不支持的整理方式: {mode}")
+
         self.source_dir = Path(source_dir)
         self.target_dir = Path(target_dir)
         self.progress_callback = progress_callback
+        self.max_workers = max_workers
+        self.log_callback = log_callback
+        self.mode = mode
+        self.exclude_dirs = set(DEFAULT_EXCLUDE_DIRS if exclude_dirs is None else exclude_dirs)
         self.file_categories = {
             '图片': ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg', '.ico', '.tiff'],
             '视频': ['.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv', '.webm', '.m4v', '.3gp'],
@@ -56,189 +186,450 @@ class WeChatFileOrganizer:
             '程序': ['.exe', '.msi', '.dmg', '.pkg', '.deb', '.rpm', '.apk'],
             '其他': []
         }
+        # 每个类别的扩展名存为frozenset，成员判断为O(1)
+        self.file_categories = {category: frozenset(extensions)
+                                for category, extensions in self.file_categories.items()}
+        # 扩展名 -> 类别的反向索引，每个文件只需一次字典查找
+        self._ext_to_cat = {ext: category
+                            for category, extensions in self.file_categories.items()
+                            for ext in extensions}
+        # 已整理文件的目标路径和被跳过文件的源路径（字符串）
         self.processed_files = []
         self.skipped_files = []
         self.total_files = 0
         self.stop_requested = False
+        self._last_reported = 0
+        self._log_buf = []
+        self._log_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        # 每个目标目录一把锁，保证并发时生成的文件名不重复
+        self._dir_locks = {category: threading.Lock() for category in self.file_categories}
+        # 按文件名分段的锁，同名文件的重复检测和复制不会同时进行
+        self._name_locks = [threading.Lock() for _ in range(NAME_LOCK_STRIPES)]
+        # 每个目标目录中已存在（或已被占用）的文件名，键由_name_key生成
+        self._existing_names = {}
+        # 目标文件系统是否不区分大小写，在create_target_directories中探测
+        self._fold_case = False
+        # 本次运行开始时为空的目标目录（类别），其中只有本次复制的文件
+        self._fresh_dirs = set()
+        # 目标目录所在设备，用于判断能否创建硬链接
+        self._target_dev = None
+        # 类别 -> 目标目录（字符串），避免热路径中反复拼接Path
+        self._cat_dirs = {}
+        # 本次整理中已计算过的文件哈希（按路径），目标文件每次运行最多计算一次
+        self._hash_cache = {}
+
+    def _log(self, message: str):
+        """写入日志缓冲区（可在任意线程中调用），由整理线程通过_flush_log统一输出"""
+        with self._log_lock:
+            self._log_buf.append(message)
+
+    def _flush_log(self, force: bool = True):
+        """
+        输出日志缓冲区，force为False时只在达到行数或时间阈值后输出
+
+        只在整理线程中调用，保证日志按顺序输出，log_callback也总在同一线程中执行
+        """
+        # 只在锁内取出缓冲区，输出时不持有锁，避免工作线程等待控制台或界面线程
+        with self._log_lock:
+            if not self._log_buf:
+                return
+            if (not force and len(self._log_buf) < LOG_FLUSH_LINES
+                    and time.monotonic() - self._last_flush < LOG_FLUSH_INTERVAL):
+                return
+            text = "\n".join(self._log_buf)
+            self._log_buf = []
+            self._last_flush = time.monotonic()
+
+        if self.log_callback:
+            self.log_callback(text)
+        else:
+            safe_print(text)
 
     def create_target_directories(self):
         """创建目标目录结构"""
-        safe_print("正在创建目标目录结构...")
+        self._log("正在创建目标目录结构...")
+        self.target_dir.mkdir(parents=True, exist_ok=True)
+        self._fold_case = self._is_case_insensitive(self.target_dir)
         for category in self.file_categories.keys():
             category_dir = self.target_dir / category
             category_dir.mkdir(parents=True, exist_ok=True)
-            safe_print(f"创建目录: {category_dir}")
-
-    def get_file_category(self, file_path: Path) -> str:
-        """根据文件扩展名确定文件类别"""
-        suffix = file_path.suffix.lower()
-
-        for category, extensions in self.file_categories.items():
-            if category != '其他' and suffix in extensions:
-                return category
-
-        return '其他'
+            self._cat_dirs[category] = str(category_dir)
+            with os.scandir(category_dir) as it:
+                self._existing_names[category] = {self._name_key(entry.name) for entry in it}
+            if not self._existing_names[category]:
+                self._fresh_dirs.add(category)
+            self._log(f"创建目录: {category_dir}")
+        self._target_dev = self.target_dir.stat().st_dev
+
+    @staticmethod
+    def _is_case_insensitive(directory: Path) -> bool:
+        """创建一个临时文件，用大小写互换后的文件名探测目录所在文件系统是否不区分大小写"""
+        fd, probe_path = tempfile.mkstemp(prefix='.case_probe_', dir=directory)
+        os.close(fd)
+        try:
+            head, name = os.path.split(probe_path)
+            return os.path.exists(os.path.join(head, name.swapcase()))
+        finally:
+            os.unlink(probe_path)
+
+    def _name_key(self, filename: str) -> str:
+        """文件名在名称索引中的键：不区分大小写的文件系统上统一转为小写"""
+        return filename.lower() if self._fold_case else filename
+
+    def get_file_category(self, file_path) -> str:
+        """根据文件扩展名确定文件类别，file_path可以是Path或os.DirEntry"""
+        # 直接从文件名字符串截取扩展名，不需要构造Path
+        name = file_path.name
+        dot = name.rfind('.')
+        suffix = name[dot:].lower() if dot >= 0 else ''
+        return self._ext_to_cat.get(suffix, '其他')
 
     def calculate_file_hash(self, file_path: Path) -> str:
-        """计算文件MD5哈希值，用于检测重复文件"""
-        hash_md5 = hashlib.md5()
+        """计算文件哈希值（优先BLAKE3，否则MD5），用于检测重复文件"""
         try:
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                # 提示内核将顺序读取整个文件，提前预读
+                _advise_sequential(f.fileno())
+
+                if blake3 is not None:
+                    # update_mmap在C中映射整个文件并行计算，不经过Python读循环
+                    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+                    hasher.update_mmap(file_path)
+                    return hasher.hexdigest()
+
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+：读取与哈希循环在hashlib内部完成
+                    return hashlib.file_digest(f, 'md5').hexdigest()
+
+                hash_md5 = hashlib.md5()
+                if os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        hash_md5.update(mm)
+                else:
+                    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                        hash_md5.update(chunk)
+                return hash_md5.hexdigest()
         except Exception as e:
-            safe_print(f"计算文件哈希失败 {file_path}: {e}")
+            self._log(f"计算文件哈希失败 {file_path}: {e}")
             return ""
 
-    def is_duplicate_file(self, source_file: Path, target_file: Path) -> bool:
-        """检查是否为重复文件"""
-        if not target_file.exists():
+    def _get_file_hash(self, file_path: Path) -> str:
+        """获取文件哈希值，优先使用本次整理中缓存的结果"""
+        key = str(file_path)
+        file_hash = self._hash_cache.get(key)
+        if file_hash is None:
+            file_hash = self.calculate_file_hash(file_path)
+            if file_hash:
+                self._hash_cache[key] = file_hash
+        return file_hash
+
+    def is_duplicate_file(self, source_file: str, target_file: str,
+                          source_stat: os.stat_result = None) -> bool:
+        """检查是否为重复文件，source_stat可传入扫描时已获取的stat结果"""
+        try:
+            target_stat = os.stat(target_file)
+        except FileNotFoundError:
+            return False
+
+        # 大小不同必然不是重复文件，无需计算哈希
+        if source_stat is None:
+            source_stat = os.stat(source_file)
+        if source_stat.st_size != target_stat.st_size:
             return False
 
+        # 同一个inode（如之前以硬链接方式整理过）必然是重复文件
+        # Windows上DirEntry.stat()的st_ino为0，此时跳过该判断
+        if (source_stat.st_ino and source_stat.st_ino == target_stat.st_ino
+                and source_stat.st_dev == target_stat.st_dev):
+            return True
+
+        # 计算源文件哈希时让内核同时预读目标文件
+        if str(target_file) not in self._hash_cache:
+            _prefetch_file(target_file)
+
         # 计算源文件和目标文件的哈希值
-        source_hash = self.calculate_file_hash(source_file)
-        target_hash = self.calculate_file_hash(target_file)
+        source_hash = self._get_file_hash(source_file)
+        target_hash = self._get_file_hash(target_file)
 
         return source_hash == target_hash and source_hash != ""
 
-    def generate_unique_filename(self, target_dir: Path, filename: str) -> Path:
-        """生成唯一的文件名，避免重名覆盖"""
-        target_path = target_dir / filename
-        stem = target_path.stem
-        suffix = target_path.suffix
+    def generate_unique_filename(self, category: str, filename: str) -> str:
+        """生成唯一的文件路径，避免重名覆盖，并将该文件名标记为已占用"""
+        existing_names = self._existing_names[category]
+        stem, suffix = os.path.splitext(filename)
+        new_filename = filename
         counter = 1
 
-        while target_path.exists():
-            new_filename = f"{stem}_{counter}{suffix}"
-            target_path = target_dir / new_filename
-            counter += 1
+        with self._dir_locks[category]:
+            while self._name_key(new_filename) in existing_names:
+                new_filename = f"{stem}_{counter}{suffix}"
+                counter += 1
+            existing_names.add(self._name_key(new_filename))
 
-        return target_path
+        return os.path.join(self._cat_dirs[category], new_filename)
 
-    def scan_files(self) -> List[Path]:
-        """扫描源目录中的所有文件"""
-        safe_print(f"正在扫描目录: {self.source_dir}")
-        all_files = []
+    def _report_progress(self, current: int, total: int, filename: str):
+        """调用进度回调，按步长节流（约200次/轮），最后一次总是报告"""
+        if not self.progress_callback:
+            return
+        step = max(1, total // 200) if total else SCAN_PROGRESS_STEP
+        if current == total or current - self._last_reported >= step:
+            self._last_reported = current
+            self.progress_callback(current, total, filename)
+
+    def _iter_files(self, path):
+        """使用os.scandir迭代遍历目录，逐个返回文件的DirEntry，跳过排除的目录"""
+        # 目标目录位于源目录内时不进入，避免遍历到刚复制的文件
+        target_dir = os.path.normcase(os.path.abspath(self.target_dir))
+        # 与fnmatch一致，按系统规则（Windows上不区分大小写）比较目录名
+        exclude_patterns = {name for name in self.exclude_dirs if any(c in name for c in '*?[')}
+        exclude_names = {os.path.normcase(name) for name in self.exclude_dirs - exclude_patterns}
+        stack = [os.path.abspath(path)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            name = entry.name
+                            if (name.startswith('.') or os.path.normcase(name) in exclude_names
+                                    or any(fnmatch.fnmatch(name, p) for p in exclude_patterns)
+                                    or os.path.normcase(entry.path) == target_dir):
+                                continue
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            yield entry
+            except OSError as e:
+                self._log(f"无法访问目录 {current}: {e}")
+
+    def iter_files(self):
+        """逐个返回源目录中的文件（DirEntry），不在内存中保存完整列表"""
+        return self._iter_files(self.source_dir)
+
+    def count_files(self) -> int:
+        """统计源目录中的文件数，用于计算整理进度"""
+        self._log(f"正在扫描目录: {self.source_dir}")
+        count = 0
 
         try:
-            # 先获取所有文件列表，用于进度计算
-            file_list = list(self.source_dir.rglob('*'))
-            total_items = len(file_list)
-
-            for i, item in enumerate(file_list):
-                # 更新扫描进度
-                if self.progress_callback:
-                    self.progress_callback(i + 1, total_items, f"扫描: {item.name}")
+            for entry in self.iter_files():
+                count += 1
 
-                if item.is_file():
-                    all_files.append(item)
+                # 更新扫描进度（总数未知，传入0）
+                self._report_progress(count, 0, f"扫描: {entry.name}")
 
         except Exception as e:
-            safe_print(f"扫描文件时出错: {e}")
+            self._log(f"扫描文件时出错: {e}")
+
+        self._log(f"找到 {count} 个文件")
+        return count
 
-        safe_print(f"找到 {len(all_files)} 个文件")
-        return all_files
+    def _process_file(self, entry: os.DirEntry) -> Tuple[str, str, int]:
+        """
+        处理单个文件（在工作线程中执行）
+
+        Returns:
+            (文件类别, 目标路径, 文件大小)，重复文件的目标路径为None
+        """
+        # 热路径中使用字符串路径，避免每个文件创建Path对象
+        source_path = entry.path
+        filename = entry.name
+
+        # 获取文件类别
+        category = self.get_file_category(entry)
+
+        # 目标路径
+        target_file_path = os.path.join(self._cat_dirs[category], filename)
+
+        # 同名文件串行处理（检查重复到复制完成），保证重复检测结果与逐个处理时一致
+        name_lock = self._name_locks[hash((category, self._name_key(filename))) % len(self._name_locks)]
+        with name_lock:
+            # 检查重复文件（目录开始时为空且该文件名未被使用时，目标文件必然不存在）
+            source_stat = entry.stat(follow_symlinks=False)
+            is_new_name = (category in self._fresh_dirs
+                           and self._name_key(filename) not in self._existing_names[category])
+            if not is_new_name and self.is_duplicate_file(source_path, target_file_path, source_stat):
+                self._log(f"跳过重复文件: {filename}")
+                return category, None, 0
+
+            # 生成唯一文件名（如果需要）
+            unique_target_path = self.generate_unique_filename(category, filename)
+
+            # 复制文件
+            try:
+                action = self._transfer_file(source_path, unique_target_path, source_stat)
+            except Exception:
+                try:
+                    os.unlink(unique_target_path)
+                except OSError:
+                    pass
+                with self._dir_locks[category]:
+                    self._existing_names[category].discard(self._name_key(os.path.basename(unique_target_path)))
+                raise
+
+            # 复制出的文件与源文件哈希相同，之后同名文件比较时无需重新计算
+            source_hash = self._hash_cache.get(source_path)
+            if source_hash:
+                self._hash_cache[unique_target_path] = source_hash
+
+        self._log(f"{_TRANSFER_VERBS[action]}: {filename} -> "
+                  f"{category}/{os.path.basename(unique_target_path)}")
+        # 复用扫描时缓存的stat结果
+        return category, unique_target_path, source_stat.st_size
+
+    def _transfer_file(self, src: str, dst: str, source_stat: os.stat_result) -> str:
+        """按整理方式将源文件放到目标路径，返回实际执行的动作（_TRANSFER_VERBS的键）"""
+        if self.mode == 'reflink':
+            return 'reflink' if _reflink_copy(src, dst) else 'copy'
+
+        # 硬链接和移动只能在同一文件系统内进行（Windows上st_dev为0，直接尝试）
+        same_device = not source_stat.st_dev or source_stat.st_dev == self._target_dev
+        if self.mode == 'link' and same_device:
+            try:
+                os.link(src, dst)
+                return 'link'
+            except OSError:
+                # 跨设备或文件系统不支持硬链接时回退到复制
+                pass
+        elif self.mode == 'move':
+            if same_device:
+                try:
+                    os.replace(src, dst)
+                    return 'move'
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+            shutil.move(src, dst, copy_function=_fast_copy)
+            return 'copy_move'
+
+        _fast_copy(src, dst)
+        return 'copy'
+
+    def _default_max_workers(self) -> int:
+        """默认线程数：网络路径延迟高，使用更多线程；本地磁盘使用少量线程即可"""
+        for path in (str(self.source_dir), str(self.target_dir)):
+            if path.startswith('\\\\') or path.startswith('//'):
+                return min(32, (os.cpu_count() or 1) * 4)
+        return 4
 
     def organize_files(self):
         """整理文件的主要方法"""
-        safe_print(f"开始整理文件...")
-        safe_print(f"源目录: {self.source_dir}")
-        safe_print(f"目标目录: {self.target_dir}")
-        safe_print("-" * 50)
+        try:
+            self._organize_files()
+        finally:
+            self._flush_log()
+
+    def _organize_files(self):
+        """整理流程：创建目录、统计文件、并发处理、输出统计"""
+        self._log(f"开始整理文件...")
+        self._log(f"源目录: {self.source_dir}")
+        self._log(f"目标目录: {self.target_dir}")
+        self._log("-" * 50)
 
         # 创建目标目录
         self.create_target_directories()
 
-        # 扫描所有文件
-        all_files = self.scan_files()
+        # 统计文件总数，整理时再重新遍历，不保存完整的文件列表
+        self._flush_log()
+        self.total_files = self.count_files()
+        self._flush_log()
 
-        if not all_files:
-            safe_print("没有找到任何文件！")
+        if not self.total_files:
+            self._log("没有找到任何文件！")
             return
-
-        # 设置总文件数
-        self.total_files = len(all_files)
+        self._last_reported = 0
 
         # 按类别统计文件
         category_stats = {category: 0 for category in self.file_categories.keys()}
         total_size = 0
 
-        for i, file_path in enumerate(all_files, 1):
-            try:
-                # 检查是否收到停止信号
-                if hasattr(self, 'stop_requested') and self.stop_requested:
-                    safe_print("收到停止信号，正在停止整理...")
+        # 多个文件同时复制/计算哈希，限制同时提交的任务数量
+        max_workers = self.max_workers or self._default_max_workers()
+        files = self.iter_files()
+        pending = {}
+        completed = 0
+        stop_noticed = False
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                # 检查是否收到停止信号，收到后不再提交新任务，等待进行中的任务完成
+                while len(pending) < max_workers * 4 and not self.stop_requested:
+                    entry = next(files, None)
+                    if entry is None:
+                        break
+                    pending[executor.submit(self._process_file, entry)] = entry
+
+                if self.stop_requested and not stop_noticed:
+                    self._log("收到停止信号，正在停止整理...")
+                    stop_noticed = True
+                    # 取消尚未开始的任务，只等待正在执行的任务完成
+                    for future in [f for f in pending if f.cancel()]:
+                        del pending[future]
+
+                if not pending:
                     break
 
-                # 更新进度回调
-                if self.progress_callback:
-                    self.progress_callback(i, self.total_files, file_path.name)
-
-                # 获取文件类别
-                category = self.get_file_category(file_path)
-
-                # 目标路径
-                target_category_dir = self.target_dir / category
-                target_file_path = target_category_dir / file_path.name
-
-                # 检查重复文件
-                if self.is_duplicate_file(file_path, target_file_path):
-                    safe_print(f"跳过重复文件: {file_path.name}")
-                    self.skipped_files.append(file_path)
-                    continue
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entry = pending.pop(future)
+                    completed += 1
 
-                # 生成唯一文件名（如果需要）
-                unique_target_path = self.generate_unique_filename(target_category_dir, file_path.name)
+                    # 更新进度回调（只在当前线程中调用）
+                    self._report_progress(completed, self.total_files, entry.name)
 
-                # 复制文件
-                shutil.copy2(file_path, unique_target_path)
+                    try:
+                        category, unique_target_path, file_size = future.result()
+                    except Exception as e:
+                        self._log(f"处理文件失败 {entry.path}: {e}")
+                        self.skipped_files.append(entry.path)
+                        continue
 
-                # 更新统计信息
-                file_size = file_path.stat().st_size
-                total_size += file_size
-                category_stats[category] += 1
-                self.processed_files.append(unique_target_path)
+                    if unique_target_path is None:
+                        self.skipped_files.append(entry.path)
+                        continue
 
-                safe_print(f"已复制: {file_path.name} -> {category}/{unique_target_path.name}")
+                    # 更新统计信息
+                    total_size += file_size
+                    category_stats[category] += 1
+                    self.processed_files.append(unique_target_path)
 
-            except Exception as e:
-                safe_print(f"处理文件失败 {file_path}: {e}")
-                self.skipped_files.append(file_path)
+                self._flush_log(force=False)
 
         # 完成进度回调
         if self.stop_requested:
-            self.progress_callback(self.total_files, self.total_files, "收到停止信号")
-            safe_print("\n整理已被用户停止")
-            safe_print(f"已处理文件: {len(self.processed_files)} 个")
-            safe_print(f"跳过文件: {len(self.skipped_files)} 个")
+            self._report_progress(self.total_files, self.total_files, "收到停止信号")
+            self._log("\n整理已被用户停止")
+            self._log(f"已处理文件: {len(self.processed_files)} 个")
+            self._log(f"跳过文件: {len(self.skipped_files)} 个")
         else:
-            self.progress_callback(self.total_files, self.total_files, "整理完成")
+            self._report_progress(self.total_files, self.total_files, "整理完成")
             # 显示统计信息
             self.show_statistics(category_stats, total_size)
 
     def show_statistics(self, category_stats: Dict[str, int], total_size: int):
         """显示整理统计信息"""
-        safe_print("\n" + "=" * 50)
-        safe_print("文件整理完成！")
-        safe_print("=" * 50)
+        self._log("\n" + "=" * 50)
+        self._log("文件整理完成！")
+        self._log("=" * 50)
 
-        safe_print("\n分类统计:")
+        self._log("\n分类统计:")
         for category, count in category_stats.items():
             if count > 0:
-                safe_print(f"  {category}: {count} 个文件")
+                self._log(f"  {category}: {count} 个文件")
 
-        safe_print(f"\n总计:")
-        safe_print(f"  成功处理: {len(self.processed_files)} 个文件")
-        safe_print(f"  跳过文件: {len(self.skipped_files)} 个文件")
-        safe_print(f"  总大小: {self.format_size(total_size)}")
+        self._log(f"\n总计:")
+        self._log(f"  成功处理: {len(self.processed_files)} 个文件")
+        self._log(f"  跳过文件: {len(self.skipped_files)} 个文件")
+        self._log(f"  总大小: {self.format_size(total_size)}")
 
-        safe_print(f"\n目标目录: {self.target_dir}")
+        self._log(f"\n目标目录: {self.target_dir}")
 
     def stop_organizing(self):
         """请求停止整理"""
         self.stop_requested = True
-        safe_print("正在发送停止信号...")
+        # 可能在界面线程中调用，只写入缓冲区，由整理线程负责输出
+        self._log("正在发送停止信号...")
 
     def format_size(self, size_bytes: int) -> str:
         """格式化文件大小显示"""
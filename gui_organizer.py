@@ -8,6 +8,7 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import threading
+import time
 import os
 from pathlib import Path
 from file_organizer import WeChatFileOrganizer
@@ -29,6 +30,7 @@ class WeChatOrganizerGUI:
         self.target_dir = tk.StringVar()
         self.organizer = None
         self.is_running = False
+        self._last_draw = 0.0
 
         # 创建界面
         self.create_widgets()
@@ -150,15 +152,29 @@ class WeChatOrganizerGUI:
         self.log_text.see(tk.END)
         self.root.update_idletasks()
 
+    def log_from_thread(self, message):
+        """从整理线程写入日志，转交给界面线程显示"""
+        self.root.after(0, self.log_message, message)
+
     def clear_log(self):
         """清空日志"""
         self.log_text.delete(1.0, tk.END)
 
     def update_progress(self, current, total, filename):
-        """更新进度显示"""
+        """更新进度显示（在整理线程中调用，转交给界面线程绘制）"""
         if not self.is_running:
             return
 
+        # 限制刷新频率（最多20次/秒），最后一次进度总是显示
+        now = time.monotonic()
+        if current != total and now - self._last_draw < 0.05:
+            return
+        self._last_draw = now
+
+        self.root.after(0, self._draw_progress, current, total, filename)
+
+    def _draw_progress(self, current, total, filename):
+        """在界面线程中绘制进度"""
         # 计算百分比
         if total > 0:
             progress_percent = (current / total) * 100
@@ -188,15 +204,16 @@ class WeChatOrganizerGUI:
                     )
             except:
                 self.progress_detail_label.config(text=f"正在处理文件 {current}/{total}")
-
-        # 更新界面
-        self.root.update_idletasks()
+        else:
+            # 扫描阶段总数未知，只显示已发现的文件数
+            self.progress_detail_label.config(text=f"🔍 扫描中: 已发现 {current} 个文件")
 
     def reset_progress(self):
         """重置进度显示"""
         self.progress_var.set(0)
         self.progress_percent_label.config(text="0%")
         self.progress_detail_label.config(text="等待开始...")
+        self._last_draw = 0.0
 
     
     def start_organizing(self):
@@ -227,55 +244,55 @@ class WeChatOrganizerGUI:
         self.reset_progress()
         self.status_label.config(text="正在整理文件...")
 
+        self.log_message("开始整理文件...")
+        self.log_message(f"源目录: {source}")
+        self.log_message(f"目标目录: {target}")
+        self.log_message("=" * 50)
+
         def organize_task():
+            # 整理线程中不直接操作界面，所有界面更新都通过root.after交给界面线程
             try:
-                self.log_message("开始整理文件...")
-                self.log_message(f"源目录: {source}")
-                self.log_message(f"目标目录: {target}")
-                self.log_message("=" * 50)
-
-                # 创建整理器，传入进度回调函数
-                self.organizer = WeChatFileOrganizer(source, target, self.update_progress)
-
-                # 重定向日志输出
-                original_print = print
-                def custom_print(*args, **kwargs):
-                    message = " ".join(str(arg) for arg in args)
-                    self.log_message(message)
-                    original_print(*args, **kwargs)
-
-                # 临时替换print函数
-                import builtins
-                builtins.print = custom_print
+                # 创建整理器，传入进度回调和日志回调函数
+                self.organizer = WeChatFileOrganizer(source, target, self.update_progress,
+                                                     log_callback=self.log_from_thread)
 
                 # 执行整理（包含自动扫描）
                 self.organizer.organize_files()
 
-                # 恢复print函数
-                builtins.print = original_print
-
-                self.progress_var.set(100)
-                self.progress_percent_label.config(text="100%")
-                self.progress_detail_label.config(text="整理完成！")
-                self.status_label.config(text="整理完成")
-                self.log_message("文件整理完成！")
-
-                messagebox.showinfo("完成", "文件整理完成！")
+                self.root.after(0, self._on_organize_done)
 
             except Exception as e:
-                self.log_message(f"整理出错: {e}")
-                self.status_label.config(text="整理失败")
-                self.progress_detail_label.config(text=f"整理失败: {str(e)}")
-                messagebox.showerror("错误", f"整理失败: {e}")
+                self.root.after(0, self._on_organize_failed, e)
 
             finally:
-                self.is_running = False
-                self.organize_button.config(state=tk.NORMAL)
-                self.stop_button.config(state=tk.DISABLED)
+                self.root.after(0, self._on_organize_finished)
 
         # 在新线程中执行整理
         threading.Thread(target=organize_task, daemon=True).start()
 
+    def _on_organize_done(self):
+        """整理完成后更新界面（在界面线程中执行）"""
+        self.progress_var.set(100)
+        self.progress_percent_label.config(text="100%")
+        self.progress_detail_label.config(text="整理完成！")
+        self.status_label.config(text="整理完成")
+        self.log_message("文件整理完成！")
+
+        messagebox.showinfo("完成", "文件整理完成！")
+
+    def _on_organize_failed(self, error):
+        """整理出错后更新界面（在界面线程中执行）"""
+        self.log_message(f"整理出错: {error}")
+        self.status_label.config(text="整理失败")
+        self.progress_detail_label.config(text=f"整理失败: {str(error)}")
+        messagebox.showerror("错误", f"整理失败: {error}")
+
+    def _on_organize_finished(self):
+        """整理结束后恢复按钮状态（在界面线程中执行）"""
+        self.is_running = False
+        self.organize_button.config(state=tk.NORMAL)
+        self.stop_button.config(state=tk.DISABLED)
+
     def stop_organizing(self):
         """停止整理"""
         if self.is_running:
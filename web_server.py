@@ -16,7 +16,22 @@ import subprocess
 import webbrowser
 import socket
 
+try:
+    from http.server import ThreadingHTTPServer
+except ImportError:
+    # Python 3.6没有ThreadingHTTPServer
+    from socketserver import ThreadingMixIn
+
+    class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+        daemon_threads = True
+
+# 超过该大小的静态文件不缓存在内存中，直接用sendfile发送
+STATIC_CACHE_MAX_SIZE = 1 << 20
+
 class OrganizerHandler(BaseHTTPRequestHandler):
+    # 静态文件缓存：路径 -> ((修改时间, 大小), 文件内容)
+    _cache = {}
+
     def __init__(self, *args, **kwargs):
         self.project_dir = Path(__file__).parent
         super().__init__(*args, **kwargs)
@@ -49,16 +64,38 @@ class OrganizerHandler(BaseHTTPRequestHandler):
     def serve_file(self, filename, content_type='text/html'):
         """提供静态文件"""
         file_path = self.project_dir / filename
-        if file_path.exists():
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            self.serve_404()
+            return
+
+        # 大文件直接由内核发送，不读入内存
+        if st.st_size > STATIC_CACHE_MAX_SIZE:
             with open(file_path, 'rb') as f:
-                content = f.read()
                 self.send_response(200)
                 self.send_header('Content-type', f'{content_type}; charset=utf-8')
-                self.send_header('Content-Length', str(len(content)))
+                self.send_header('Content-Length', str(st.st_size))
                 self.end_headers()
-                self.wfile.write(content)
+                self.connection.sendfile(f)
+            return
+
+        # 文件未修改时直接使用缓存的内容
+        key = str(file_path)
+        version = (st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(key)
+        if cached and cached[0] == version:
+            content = cached[1]
         else:
-            self.serve_404()
+            with open(file_path, 'rb') as f:
+                content = f.read()
+            self._cache[key] = (version, content)
+
+        self.send_response(200)
+        self.send_header('Content-type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
 
     def start_program(self):
         """启动程序"""
@@ -191,9 +228,9 @@ def main():
     print("-" * 40)
 
     try:
-        # 启动Web服务器
+        # 启动Web服务器（每个请求在独立线程中处理）
         server_address = ('', port)
-        httpd = HTTPServer(server_address, OrganizerHandler)
+        httpd = ThreadingHTTPServer(server_address, OrganizerHandler)
 
         # 自动打开浏览器
         def open_browser():